@@ -143,7 +143,7 @@ class MemPath(Path):
             return FileStat(is_dir=True)
 
         if name not in parent:
-            return FileNotFoundError(self)
+            raise FileNotFoundError(self)
 
         return FileStat(is_dir=isinstance(parent[name], dict))
 
@@ -159,11 +159,16 @@ class MemPath(Path):
 
     def _open(self, mode="r", buffering=-1) -> IOBase:
         parent, name = self._parent_container()
-        if "w" in mode:
+        if "x" in mode:
+            if name in parent:
+                raise FileExistsError(self)
+            content = parent.setdefault(name, bytearray())
+            return MemBytesIO(content)
+        elif "w" in mode:
             content = parent.setdefault(name, bytearray())
             return MemBytesIO(content)
         elif name not in parent:
-            return FileNotFoundError(self)
+            raise FileNotFoundError(self)
         else:
             content = parent[name]
 
@@ -8,10 +8,12 @@ operating systems.
 import abc as _abc
 import os as _os
 import re as _re
+import stat as _stat
 import typing as _ty
 
 from . import utils as _utils
 from .protocols import BinaryOpen, Chmod, Stat
+from .protocols.io import _copyfileobj
 from .utils import glob as _glob
 from .utils.stat import FileStat
 
@@ -38,7 +40,7 @@ class _PathnameParents(_ty.Sequence[PN]):
     """This object provides sequence-like access to the logical ancestors
     of a path.  Don't try to construct it yourself."""
 
-    __slots__ = ("_path", "_segments")
+    __slots__ = ("_path", "_segments", "_parents")
 
     def __init__(self, path: PN):
         self._path = path
@@ -46,6 +48,7 @@ class _PathnameParents(_ty.Sequence[PN]):
         while segments and not segments[-1]:
             segments = segments[:-1]
         self._segments = segments
+        self._parents: "list[PN | None]" = [None] * len(segments)
 
     def __len__(self):
         return len(self._segments)
@@ -62,7 +65,14 @@ class _PathnameParents(_ty.Sequence[PN]):
             raise IndexError(idx)
         if idx < 0:
             idx += len(self)
-        return self._path.with_segments(*self._segments[: -idx - 1])
+        parent = self._parents[idx]
+        if parent is None:
+            parent = self._make_parent(self._segments[: -idx - 1])
+            self._parents[idx] = parent
+        return parent
+
+    def _make_parent(self, segments: _ty.Sequence[str]) -> PN:
+        return self._path.with_segments(*segments)
 
     def __repr__(self):
         return "<{}.parents>".format(type(self._path).__name__)
@@ -250,6 +260,14 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
         """
         ...
 
+    def _iterdir_modes(self) -> "_ty.Iterator[tuple[_ty.Self, int | None]]":
+        """
+        iterdir() entries with the st_mode reported by the listing, if any.
+        For walk only, the mode is a snapshot and is not kept on the entry
+        """
+        for entry in self.iterdir():
+            yield entry, None
+
     def glob(
         self,
         pattern: str | _ty.Self,
@@ -285,7 +303,7 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
                 yield path
                 continue
             try:
-                scandir_it = path.iterdir()
+                scandir_it = path._iterdir_modes()
             except OSError as error:
                 if on_error is not None:
                     on_error(error)
@@ -293,25 +311,32 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
 
             dirnames: "list[str]" = []
             filenames: "list[str]" = []
-            for entry in scandir_it:
+            dirs: "dict[str, _ty.Self]" = {}
+            for entry, mode in scandir_it:
                 try:
-                    stat = FileStat.from_path(entry, follow_symlink=follow_symlinks)
-                    is_dir = stat.is_dir()
+                    # symlinks from the listing still have to be resolved
+                    if mode is None or follow_symlinks and _stat.S_ISLNK(mode):
+                        mode = entry._st_mode(follow_symlinks=follow_symlinks)
+                    is_dir = _stat.S_ISDIR(mode or 0)
                 except OSError:
                     # Carried over from os.path.isdir().
                     is_dir = False
 
+                name = entry.name
                 if is_dir:
-                    dirnames.append(entry.name)
+                    dirnames.append(name)
+                    dirs[name] = entry
                 else:
-                    filenames.append(entry.name)
+                    filenames.append(name)
 
             if top_down:
                 yield path, dirnames, filenames
             else:
                 paths.append((path, dirnames, filenames))
 
-            paths += [path / d for d in reversed(dirnames)]
+            # reuse the entries from iterdir, dirnames may have been pruned
+            # or extended by the caller while top_down
+            paths += [dirs[d] if d in dirs else path / d for d in reversed(dirnames)]
 
     def touch(self, mode=0o666, exist_ok=True):
         """
@@ -341,8 +366,29 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
         except FileNotFoundError:
             if not parents or self.parent == self:
                 raise
-            self.parent.mkdir(parents=True, exist_ok=False)
-            self.mkdir(mode, parents=False, exist_ok=False)
+            # walk up to the deepest existing ancestor, then create the
+            # missing ones top down
+            missing = [self]
+            while True:
+                path = missing[-1].parent
+                try:
+                    path._mkdir(0o777)
+                except FileNotFoundError:
+                    if path.parent == path:
+                        raise
+                    missing.append(path)
+                    continue
+                except FileExistsError:
+                    if not path.is_dir():
+                        raise
+                break
+            for path in reversed(missing[1:]):
+                try:
+                    path._mkdir(0o777)
+                except FileExistsError:
+                    if not path.is_dir():
+                        raise
+            self.mkdir(mode, exist_ok=exist_ok)
         except FileExistsError:
             if not exist_ok or not self.is_dir():
                 raise
@@ -396,18 +442,27 @@ class Path(Pathname, Chmod, Stat, BinaryOpen):
         if src is None:
             return
 
-        if target.exists():
-            if overwrite:
+        if overwrite:
+            if target.exists():
                 target.unlink()
-            else:
-                raise FileExistsError(target)
-        BinaryOpen.copy(src, target)
-
-        try:
-            stat = src.stat()
-            target.chmod(stat.st_mode)
-        except NotImplementedError:
-            pass
+            BinaryOpen.copy(src, target)
+        else:
+            # let the backend refuse an existing target instead of checking first
+            try:
+                output = target.open("xb")
+            except NotImplementedError:
+                if target.exists():
+                    raise FileExistsError(target)
+                output = target.open("wb")
+            with output, src.open("rb") as input:
+                _copyfileobj(input, output)
+
+        if type(target).chmod is not Chmod.chmod:
+            try:
+                stat = src.stat()
+                target.chmod(stat.st_mode)
+            except NotImplementedError:
+                pass
 
     def move(self, target: "Path|str", *, overwrite=False):
         if isinstance(target, str):
@@ -42,7 +42,7 @@ class Stat(_ty.Protocol):
         not required nor to be expected in any implementations of the protocol
         """
         try:
-            return self.stat().st_mode
+            return self.stat(follow_symlinks=follow_symlinks).st_mode
         except FileNotFoundError:
             return None
         except ValueError:
@@ -1,9 +1,67 @@
 import io as _io
+import os as _os
 import shutil as _shutil
+import stat as _stat
 import typing as _ty
 
 from .. import utils as _utils
 
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _fileno(stream: _io.IOBase):
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _sendfile(input: _io.IOBase, output: _io.IOBase) -> bool:
+    """
+    Copy a regular file with sendfile, return False when the streams do not
+    allow it and nothing was copied
+    """
+    infd, outfd = _fileno(input), _fileno(output)
+    if infd is None or outfd is None or not hasattr(_os, "sendfile"):
+        return False
+    try:
+        st = _os.fstat(infd)
+    except OSError:
+        return False
+    # st_size can't be trusted for pipes or files like /proc/*
+    if not _stat.S_ISREG(st.st_mode) or not input.seekable():
+        return False
+    blocksize = max(min(st.st_size, 2**30), 2**23)
+    output.flush()
+    offset = start = input.tell()
+    try:
+        while sent := _os.sendfile(outfd, infd, offset, blocksize):
+            offset += sent
+    except OSError:
+        # sendfile not supported for these descriptors, use a buffer copy
+        if offset != start:
+            raise
+        return False
+    input.seek(offset)
+    return True
+
+
+def _copyfileobj(input: _io.IOBase, output: _io.IOBase):
+    """
+    Copy input into output, letting the kernel move the data with sendfile
+    when copying from a regular file
+    """
+    if _sendfile(input, output):
+        return
+    readinto = getattr(input, "readinto", None)
+    if readinto is None:
+        _shutil.copyfileobj(input, output, _COPY_BUFSIZE)
+        return
+    # one buffer for the whole copy instead of a new bytes per chunk
+    with memoryview(bytearray(_COPY_BUFSIZE)) as view:
+        while n := readinto(view):
+            output.write(view[:n])
+
 
 class BinaryOpen(_ty.Protocol):
     """Protocol for objects that support open->io.IoBase"""
@@ -19,6 +77,9 @@ class BinaryOpen(_ty.Protocol):
         """
         All operations should be binary
         To be used only by open() to obtain binary stream to provide implementations for all methods
+        Mode 'x' creates the object and raises FileExistsError if it exists,
+        modes not supported must raise NotImplementedError, Path.copy falls
+        back to checking exists() only on NotImplementedError for 'x'
         """
         ...
 
@@ -77,4 +138,4 @@ class BinaryOpen(_ty.Protocol):
 
     def copy(self, target: "BinaryOpen"):
         with target.open("wb") as output, self.open("rb") as input:
-            _shutil.copyfileobj(input, output)
+            _copyfileobj(input, output)
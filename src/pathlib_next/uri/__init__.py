@@ -1,7 +1,13 @@
+import functools as _functools
+import itertools as _itertools
 import os
 import pathlib as _pathlib
 import posixpath as _posix
+import re as _re
+import string as _string
+import sys as _sys
 import typing as _ty
+from urllib.parse import unquote_to_bytes as _unquote_to_bytes
 
 import uritools
 
@@ -9,21 +15,238 @@ if _ty.TYPE_CHECKING:
     from typing import Self
 
 from .. import utils as _utils
-from ..path import Path, Pathname
+from ..path import Path, Pathname, _PathnameParents
 from .query import Query
-from .source import Source
+from .source import _NOSOURCE, Source, _intern_source
 
 UriLike: _ty.TypeAlias = "str | Uri | os.PathLike"
 
-_NOSOURCE = Source(None, None, None, None)
+_EMPTY_QUERY = Query("")
+_UNSET: _ty.Any = object()
+_UNPICKLED_SLOTS = ("_uri", "_hash", "_normalized_path")
+_DOT_SEGMENT = _re.compile(r"(?:^|/)\.\.?(?:/|$)")
 
 _U = _ty.TypeVar("_U", bound="Uri")
 
+# scheme -> UriPath subclass, filled in as subclasses are defined
+_SCHEMESMAP: "dict[str, type[UriPath]]" = {}
+
+
+_UNRESERVED = frozenset(_string.ascii_letters + _string.digits + "-._~")
+
 
 def _uriencode(text: str, safe=""):
+    chars = set(text)
+    chars -= _UNRESERVED
+    if chars.issubset(safe):
+        # nothing to encode
+        return text
     return uritools.uriencode(text, safe=safe).decode()
 
 
+def _is_plain_path(uri: str):
+    """True if uri is a bare path that urisplit would return unchanged:
+    no scheme, authority, query, fragment, percent-escapes or dot-segments"""
+    if "?" in uri or "#" in uri or "%" in uri or uri.startswith("//"):
+        return False
+    colon = uri.find(":")
+    if colon >= 0 and not (-1 < uri.find("/") < colon):
+        return False
+    return "." not in uri or _DOT_SEGMENT.search(uri) is None
+
+
+# same split as uritools.urisplit, authority is broken up by _split_uri
+_URI_RE = _re.compile(
+    r"(?:([A-Za-z][A-Za-z0-9+.-]*):)?(?://([^/?#]*))?([^?#]*)(?:\?([^#]*))?(?:#(.*))?"
+)
+
+
+# uris that _format_parsed_parts would compose back unchanged: lowercase
+# scheme and host, no percent-escapes, no empty port, query or fragment.
+# hosts starting with a digit are left out, uritools may read them as
+# an ip address or a port
+_SAFE = r"A-Za-z0-9\-._~!$&'()*+,;="
+_CANONICAL_URI = _re.compile(
+    rf"""
+    (?P<scheme>[a-z][a-z0-9+.\-]*:)?
+    (?:
+        (?P<authority>//(?=[^/?\#])
+            (?:[{_SAFE}:]+@)?
+            (?:[a-z\-._~!$&'()*+,;=][a-z0-9\-._~!$&'()*+,;=]*)?
+            (?::[1-9][0-9]*)?
+            (?=[/?\#]|\Z)
+        )
+        |(?!//)
+    )
+    (?P<path>[{_SAFE}:@/]*)
+    (?:\?[{_SAFE}:@/?]+)?
+    (?:\#[{_SAFE}:@/?]+)?
+    \Z
+    """,
+    _re.VERBOSE,
+)
+
+
+def _is_canonical_uri(uri: str):
+    match = _CANONICAL_URI.match(uri)
+    if match is None:
+        return False
+    path = match["path"]
+    if "." in path and _DOT_SEGMENT.search(path):
+        return False
+    if match["scheme"] is None and match["authority"] is None:
+        return ":" not in path.partition("/")[0]
+    return True
+
+
+def _uridecode(text: str):
+    # same result as uritools.uridecode
+    return _unquote_to_bytes(text).decode() if "%" in text else text
+
+
+def _urisplit(uri: str) -> tuple[Source, str, Query, str]:
+    parsed = uritools.urisplit(uri)
+    return (
+        _intern_source(
+            parsed.getscheme(),
+            parsed.getuserinfo(),
+            parsed.gethost() or "",
+            parsed.getport(),
+        ),
+        parsed.getpath(),
+        Query(parsed.getquery() or ""),
+        parsed.getfragment() or "",
+    )
+
+
+def _split_uri(uri: str) -> tuple[Source, str, Query, str]:
+    if "@" in uri:
+        # not memoized, the cache would keep the userinfo and its password
+        return _cached_split_uri.__wrapped__(uri)
+    return _cached_split_uri(uri)
+
+
+@_functools.lru_cache(maxsize=4096)
+def _cached_split_uri(uri: str) -> tuple[Source, str, Query, str]:
+    scheme, authority, path, query, fragment = _URI_RE.match(uri).groups()
+    if "." in path and _DOT_SEGMENT.search(path):
+        return _urisplit(uri)
+    userinfo = port = None
+    host = ""
+    if authority is not None:
+        if "[" in authority or "]" in authority:
+            return _urisplit(uri)
+        userinfo, at, host = authority.rpartition("@")
+        userinfo = _uridecode(userinfo) if at else None
+        _host, colon, port = host.rpartition(":")
+        if colon and not port.strip("0123456789"):
+            host = _host
+            port = int(port) if port else None
+        else:
+            port = None
+        if host[:1].isdigit():
+            # possible IPv4 address, uritools returns an ip_address for those
+            return _urisplit(uri)
+        host = _uridecode(host).lower()
+    return (
+        _intern_source(scheme and scheme.lower(), userinfo, host, port),
+        _uridecode(path),
+        Query(_uridecode(query)) if query else _EMPTY_QUERY,
+        _uridecode(fragment) if fragment else "",
+    )
+
+
+# components made only of these are left as is by uricompose
+_SCHEME_RE = _re.compile(r"[a-z][a-z0-9+.\-]*")
+_SAFE_USERINFO = _re.compile(rf"[{_SAFE}:]*")
+_SAFE_HOST = _re.compile(r"[a-z0-9\-._~!$&'()*+,;=]*")
+_SAFE_PATH = _re.compile(rf"[{_SAFE}:@/]*")
+_SAFE_QUERY = _re.compile(rf"[{_SAFE}:@/?]*")
+
+
+def _fast_compose(
+    scheme: str | None,
+    userinfo: str | None,
+    host: str | None,
+    port: int | None,
+    path: str,
+    query: str,
+    fragment: str,
+) -> str | None:
+    """Same as uricompose for components that need no encoding or
+    validation, None if uricompose has to be used"""
+    if (
+        (scheme and not _SCHEME_RE.fullmatch(scheme))
+        or (userinfo and not _SAFE_USERINFO.fullmatch(userinfo))
+        or (host and not (isinstance(host, str) and _SAFE_HOST.fullmatch(host)))
+        or (port and not (type(port) is int and port > 0))
+        or not _SAFE_PATH.fullmatch(path)
+        or (query and not _SAFE_QUERY.fullmatch(query))
+        or (fragment and not _SAFE_QUERY.fullmatch(fragment))
+    ):
+        return None
+    uri = f"{scheme}:" if scheme else ""
+    if userinfo or host or port:
+        if path and path[0] != "/":
+            return None
+        uri += "//"
+        if userinfo:
+            uri += f"{userinfo}@"
+        if host:
+            uri += host
+        if port:
+            uri += f":{port}"
+    elif path.startswith("//"):
+        return None
+    elif not scheme and ":" in path.partition("/")[0]:
+        uri += "./"
+    uri += path
+    if query:
+        uri += f"?{query}"
+    if fragment:
+        uri += f"#{fragment}"
+    return uri
+
+
+def _compose_uri(
+    source: Source, path: str, query: str, fragment: str, sanitize: bool
+) -> str:
+    if source.userinfo:
+        # not memoized, the cache would keep the userinfo and its password
+        return _cached_compose_uri.__wrapped__(source, path, query, fragment, sanitize)
+    return _cached_compose_uri(source, path, query, fragment, sanitize)
+
+
+@_functools.lru_cache(maxsize=2048)
+def _cached_compose_uri(
+    source: Source, path: str, query: str, fragment: str, sanitize: bool
+) -> str:
+    scheme, userinfo, host, port = source
+    if userinfo and sanitize:
+        userinfo = userinfo.partition(":")[0]
+    uri = _fast_compose(scheme, userinfo, host, port, path, query, fragment)
+    if uri is not None:
+        return uri
+
+    parts = {}
+    if path:
+        parts["path"] = path
+    if query:
+        parts["query"] = query
+    if fragment:
+        parts["fragment"] = fragment
+    if scheme:
+        parts["scheme"] = scheme
+    if userinfo:
+        parts["userinfo"] = userinfo
+    if host:
+        parts["host"] = host
+    if port:
+        parts["port"] = port
+
+    return uritools.uricompose(**parts)
+
+
 class Uri(Pathname):
 
     __slots__ = (
@@ -33,73 +256,67 @@ class Uri(Pathname):
         "_query",
         "_fragment",
         "_uri",
-        "_initiated",
         "_normalized_path",
+        "_hash",
     )
 
+    # __init__ marks the parts and uri as _UNSET until they are loaded,
+    # instances built from parsed parts go through _init only
+
     def __new__(cls, *uris, **options):
-        inst = object.__new__(cls)
-        for cls in cls.__mro__:
-            for slot in getattr(cls, "__slots__", ()):
-                if not hasattr(inst, slot):
-                    setattr(inst, slot, None)
-        return inst
+        return object.__new__(cls)
 
     def __init__(self, *uris: UriLike, **options):
-        if self._raw_uris or self._initiated:
+        if hasattr(self, "_source"):
             return
-        _uris: list[str | Uri] = []
-        for uri in uris:
-            if not uri:
-                uri = ""
-            if isinstance(uri, Uri):
-                _uris.append(uri)
-            elif isinstance(uri, (_pathlib.Path, Path)):
-                try:
-                    uri = uri.as_uri()
-                except:
-                    uri = f"file:{_uriencode(uri.as_posix(), safe='/')}"
-                _uris.append(uri)
-            elif isinstance(uri, (_pathlib.PurePath, Pathname)):
-                _uris.append(f"{_uriencode(uri.as_posix(), safe='/')}")
-            elif hasattr(uri, "as_uri"):
-                path = uri.as_uri
-                if callable(path):
-                    path = path()
-                _uris.append(path)
-            elif isinstance(uri, str):
-                _uris.append(uri)
-            elif isinstance(uri, bytes):
-                _uris.append(uri.decode())
-            else:
-                path = None
-                try:
-                    path = os.fspath(uri)
-                except (TypeError, NotImplementedError):
-                    pass
-                if not isinstance(path, str):
-                    raise TypeError(
-                        "argument should be a str or an os.PathLike "
-                        "object where __fspath__ returns a str, "
-                        f"not {type(path).__name__!r}"
-                    )
-                _uris.append(f"{_uriencode(uri.as_posix(), safe='/')}")
+        _uris: "_ty.Sequence[str | Uri]" = uris
+        if not all(type(uri) is str or isinstance(uri, Uri) for uri in uris):
+            # coerce paths and other objects, str and Uri are parsed lazily
+            _uris = []
+            for uri in uris:
+                if not uri:
+                    uri = ""
+                if isinstance(uri, Uri):
+                    _uris.append(uri)
+                elif isinstance(uri, (_pathlib.Path, Path)):
+                    try:
+                        uri = uri.as_uri()
+                    except:
+                        uri = f"file:{_uriencode(uri.as_posix(), safe='/')}"
+                    _uris.append(uri)
+                elif isinstance(uri, (_pathlib.PurePath, Pathname)):
+                    _uris.append(f"{_uriencode(uri.as_posix(), safe='/')}")
+                elif hasattr(uri, "as_uri"):
+                    path = uri.as_uri
+                    if callable(path):
+                        path = path()
+                    _uris.append(path)
+                elif isinstance(uri, str):
+                    _uris.append(uri)
+                elif isinstance(uri, bytes):
+                    _uris.append(uri.decode())
+                else:
+                    path = None
+                    try:
+                        path = os.fspath(uri)
+                    except (TypeError, NotImplementedError):
+                        pass
+                    if not isinstance(path, str):
+                        raise TypeError(
+                            "argument should be a str or an os.PathLike "
+                            "object where __fspath__ returns a str, "
+                            f"not {type(path).__name__!r}"
+                        )
+                    _uris.append(f"{_uriencode(uri.as_posix(), safe='/')}")
         self._raw_uris = _uris
+        self._source = self._path = self._query = self._fragment = _UNSET
+        self._uri = _UNSET
 
     @classmethod
     def _parse_uri(cls, uri: str) -> tuple[Source, str, Query, str]:
-        parsed = uritools.urisplit(uri)
-        return (
-            Source(
-                parsed.getscheme(),
-                parsed.getuserinfo(),
-                parsed.gethost() or "",
-                parsed.getport(),
-            ),
-            parsed.getpath(),
-            Query(parsed.getquery() or ""),
-            parsed.getfragment() or "",
-        )
+        if _is_plain_path(uri):
+            return _NOSOURCE, uri, _EMPTY_QUERY, ""
+        return _split_uri(uri)
 
     @property
     def parts(self):
@@ -111,46 +328,63 @@ class Uri(Pathname):
         query = fragment = None
         _path = ""
 
+        uri = None
         if not uris:
             pass
         elif len(uris) == 1 and isinstance(uris[0], Uri):
             source, _path, query, fragment = uris[0].parts
+            uri = uris[0]._uri
         else:
+            # single pass from the last uri, the query and fragment are the
+            # last uri's, the source the last one set, and the path stops at
+            # the last absolute one
             paths: list[str] = []
-            for _uri in uris:
-                src, path, query, fragment = (
+            absolute = False
+            for idx, _uri in enumerate(reversed(uris)):
+                src, path, _query, _fragment = (
                     _uri.parts if isinstance(_uri, Uri) else self._parse_uri(_uri)
                 )
-                if bool(src):
+                if not idx:
+                    query, fragment = _query, _fragment
+                if path and not absolute:
+                    paths.append(path)
+                    absolute = path.startswith("/")
+                if src and not source:
                     source = src
-                paths.append(path)
-
-            for path in reversed(paths):
-                if not path:
-                    continue
-                if path.endswith("/"):
-                    _path = f"{path}{_path}"
-                elif _path:
-                    _path = f"{path}/{_path}"
-                else:
-                    _path = path
-                if _path.startswith("/"):
+                if absolute and source:
                     break
 
+            if paths:
+                paths.reverse()
+                last = paths.pop()
+                _path = "".join(p if p.endswith("/") else f"{p}/" for p in paths)
+                _path += last
+
         if (
             (source.host or source.userinfo or source.port)
             and _path
             and not _path.startswith("/")
         ):
             _path = "/" + _path
+        elif uri is None:
+            uri = self._raw_uri()
 
         self._init(source, _path, query, fragment)
+        if uri is not None and self._path == _path:
+            self._uri = uri
+
+    def _raw_uri(self) -> str | None:
+        """The raw string this uri was built from, if as_uri would compose
+        exactly the same string from its parsed parts"""
+        uris = self._raw_uris
+        if uris and len(uris) == 1:
+            uri = uris[0]
+            if isinstance(uri, str) and _is_canonical_uri(uri):
+                return uri
+        return None
 
     def _init(self, source: Source, path: str, query: str, fragment: str, **kwargs):
-        if self._initiated:
-            pass
-            # raise Exception(f"Uri._init should only be called once")
-        self._initiated = True
+        self._uri = None
         self._source = source
         self._path = path
         self._query = query
@@ -174,22 +408,7 @@ class Uri(Pathname):
         /,
         sanitize=True,
     ) -> str:
-        parts = {
-            "path": path,
-        }
-        if query:
-            parts["query"] = query
-        if fragment:
-            parts["fragment"] = fragment
-        if source:
-            source_ = source._asdict()
-            if sanitize:
-                source_["userinfo"] = (source_["userinfo"] or "").split(
-                    ":", maxsplit=1
-                )[0]
-            parts.update(source_)
-
-        return uritools.uricompose(**{k: v for k, v in parts.items() if v})
+        return _compose_uri(source, path, query, fragment, bool(sanitize))
 
     def __str__(self):
         """Return the string representation of the path, suitable for
@@ -208,52 +427,94 @@ class Uri(Pathname):
         raise NotImplementedError(f"fspath for {self.source.scheme}")
 
     def __repr__(self):
-        if self._initiated:
+        if getattr(self, "_source", _UNSET) is not _UNSET:
             return "{}({!r})".format(type(self).__name__, str(self))
         else:
             return super().__repr__()
 
     def as_uri(self, /, sanitize=False):
-        if self._uri is None or sanitize:
-            uri = self._format_parsed_parts(
-                self.source, self.path, self.query, self.fragment, sanitize=sanitize
-            )
-            if not sanitize:
-                self._uri = uri
+        uri = self._uri
+        if uri is _UNSET:
+            # no need to parse a uri that is already in canonical form
+            uri = self._uri = self._raw_uri()
+        if uri is not None and not (sanitize and "@" in uri):
             return uri
-        else:
-            return self._uri
+        source = self.source
+        if sanitize and source.userinfo and ":" in source.userinfo:
+            return self._format_parsed_parts(
+                source, self.path, self.query, self.fragment, sanitize=True
+            )
+        if self._uri is None:
+            self._uri = self._format_parsed_parts(
+                source, self.path, self.query, self.fragment, sanitize=False
+            )
+        return self._uri
 
     @property
     def source(self) -> Source:
-        if not self._initiated:
+        source = self._source
+        if source is _UNSET:
             self._load_parts()
-        return self._source
+            source = self._source
+        return source
 
     @property
     def path(self) -> str:
-        if not self._initiated:
+        path = self._path
+        if path is _UNSET:
             self._load_parts()
-        return self._path
+            path = self._path
+        return path
 
     @property
     def query(self) -> str:
-        if not self._initiated:
+        query = self._query
+        if query is _UNSET:
             self._load_parts()
-        return self._query
+            query = self._query
+        return query
 
     @property
     def fragment(self) -> str:
-        if not self._initiated:
+        fragment = self._fragment
+        if fragment is _UNSET:
             self._load_parts()
-        return self._fragment
+            fragment = self._fragment
+        return fragment
+
+    def _join_plain(self, key: str, **kwargs) -> "_ty.Self | None":
+        """self / key without parsing key, None if key is not a plain path.
+        Same result as _load_parts for (self, key)"""
+        if not isinstance(key, str) or not _is_plain_path(key):
+            return None
+        source, path = self.source, self.path
+        if key.startswith("/") or not path:
+            path = key or path
+        elif key:
+            path = f"{path}{key}" if path.endswith("/") else f"{path}/{key}"
+        if (
+            (source.host or source.userinfo or source.port)
+            and path
+            and not path.startswith("/")
+        ):
+            path = "/" + path
+        cls = type(self)
+        inst = cls.__new__(cls)
+        inst._init(source, path, _EMPTY_QUERY, "", **kwargs)
+        return inst
+
+    def __truediv__(self, key: UriLike):
+        inst = self._join_plain(key)
+        return super().__truediv__(key) if inst is None else inst
+
+    def _child_prefix(self):
+        path = self.path
+        return path if not path or path.endswith("/") else f"{path}/"
 
     def _make_child_relpath(self, name: str, **kwargs) -> _ty.Self:
         cls = type(self)
         inst = cls.__new__(cls)
-        inst._init(
-            self.source, f"{self.path}/{name}" if self.path else name, "", "", **kwargs
-        )
+        inst._init(self.source, self._child_prefix() + name, "", "", **kwargs)
         return inst
 
     def with_source(self, source: Source):
@@ -280,25 +541,33 @@ class Uri(Pathname):
     def with_fragment(self, fragment: str):
         return self._from_parsed_parts(self.source, self.path, self.query, fragment)
 
+    @property
+    def parents(self) -> "_ty.Sequence[_ty.Self]":
+        return _UriParents(self)
+
     @property
     def segments(self):
         if not self.path:
             return ()
         return self.path.split("/")
 
+    @property
+    def name(self) -> str:
+        """The final path component, if any."""
+        return self.path.rpartition("/")[2]
+
     @property
     def parent(self):
         """The logical parent of the path."""
-        segments = self.segments
-        if not segments or len(segments) == 2 and segments[1] == "":
+        path = self.path
+        head, sep, tail = path.rpartition("/")
+        if not path or sep and not tail and "/" not in head:
             return self
-        return self.with_path("/".join(segments[:-1]))
+        return self.with_path(head)
 
-    @property
-    def normalized_path(self):
-        if self._normalized_path is None:
-            self._normalized_path = _posix.normpath(self.path)
-        return self._normalized_path
+    @_utils.cached_slot
+    def normalized_path(self) -> str:
+        return _posix.normpath(self.path)
 
     def is_absolute(self):
         """True if the path is absolute."""
@@ -306,22 +575,26 @@ class Uri(Pathname):
 
     def is_relative_to(self, other: UriLike):
         """Return True if the path is relative to another path or False."""
-        other = other if isinstance(other, Uri) else Uri(self, _ROOT, other)
-        if not (
-            (other.source == self.source)
-            or not (bool(self.source) and bool(other.source))
-        ):
-            return False
-        _other = other.normalized_path
+        if isinstance(other, str) and _is_plain_path(other):
+            # same as joining it to _ROOT under this uri's source
+            _other = _posix.normpath(other if other[:1] == "/" else f"/{other}")
+        else:
+            other = other if isinstance(other, Uri) else Uri(self, _ROOT, other)
+            if not (
+                (other.source == self.source)
+                or not (bool(self.source) and bool(other.source))
+            ):
+                return False
+            _other = other.normalized_path
         _self = self.normalized_path
-        return _self.startswith(_other)
+        return _self == _other or _self.startswith(_other.rstrip("/") + "/")
 
     def relative_to(self, other: UriLike, *, walk_up=False):
         other = other if isinstance(other, Uri) else Uri(other)
         if not self.is_relative_to(other):
             raise ValueError(f"{str(self)!r} is not in the subpath of {str(other)!r}")
 
-        for step, path in enumerate([other] + list(other.parents)):
+        for step, path in enumerate(_itertools.chain((other,), other.parents)):
             if self.is_relative_to(path):
                 break
             elif not walk_up:
@@ -341,9 +614,33 @@ class Uri(Pathname):
         return self.source.is_local()
 
     def __eq__(self, other: Pathname | str):
+        if self is other:
+            return True
+        if type(other) is type(self):
+            raw = getattr(self, "_raw_uris", None)
+            if raw is not None and raw == getattr(other, "_raw_uris", None):
+                return True
         uri = other.as_uri() if isinstance(other, Pathname) else other
         return self.as_uri() == uri
 
+    def __hash__(self):
+        # consistent with __eq__, equal uris compare equal to their str too
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.as_uri())
+            return self._hash
+
+    def __getstate__(self):
+        # pickle the parsed parts, never the _UNSET sentinel, and leave out
+        # the per process caches, str hashes change between processes
+        self.source
+        dict_, slots = super().__getstate__()
+        for cache in _UNPICKLED_SLOTS:
+            slots.pop(cache, None)
+        slots["_uri"] = None
+        return dict_, slots
+
     def as_posix(self):
         source = self.source
         host = None
@@ -358,39 +655,52 @@ class Uri(Pathname):
         return posix
 
 
+class _UriParents(_PathnameParents[_U]):
+    """Parents of a uri, built straight from the parts shared with it"""
+
+    __slots__ = ("_source", "_query", "_fragment")
+
+    def __init__(self, path: _U):
+        super().__init__(path)
+        self._source = path.source
+        self._query = path.query
+        self._fragment = path.fragment
+
+    def _make_parent(self, segments: _ty.Sequence[str]) -> _U:
+        return self._path._from_parsed_parts(
+            self._source, "/".join(segments), self._query, self._fragment
+        )
+
+
 class UriPath(Uri, Path):
     __slots__ = ("_backend",)
-    __SCHEMES: _ty.Sequence[str] = ()
-    __SCHEMESMAP: _ty.Mapping[str, type["Self"]] = None
+    __SCHEMES: _ty.Collection[str] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        attr = f"_{cls.__name__}__SCHEMES"
+        if attr in cls.__dict__:
+            setattr(cls, attr, frozenset(_sys.intern(s) for s in cls.__dict__[attr]))
+        for scheme in cls._schemes():
+            _SCHEMESMAP[scheme] = cls
 
     @classmethod
-    def _schemesmap(cls, reload=False) -> _ty.Mapping[str, type["Self"]]:
-        _propname = f"_{cls.__name__}__SCHEMESMAP"
-        if not reload:
-            try:
-                schemesmap = getattr(cls, _propname)
-                if schemesmap is not None:
-                    return schemesmap
-            except AttributeError:
-                pass
-        schemesmap = cls._get_schemesmap()
-        setattr(cls, _propname, schemesmap)
-        return schemesmap
+    def _schemesmap(cls) -> _ty.Mapping[str, type["Self"]]:
+        if cls is UriPath:
+            return _SCHEMESMAP
+        return {
+            scheme: scls
+            for scheme, scls in _SCHEMESMAP.items()
+            if issubclass(scls, cls)
+        }
 
     @classmethod
-    def _schemes(cls) -> _ty.Sequence[str]:
+    def _schemes(cls) -> _ty.Collection[str]:
         try:
             return getattr(cls, f"_{cls.__name__}__SCHEMES")
         except AttributeError as _e:
             return ()
 
-    @classmethod
-    def _get_schemesmap(cls):
-        schemesmap = {scheme: cls for scheme in cls._schemes()}
-        for scls in cls.__subclasses__():
-            schemesmap.update(scls._get_schemesmap())
-        return schemesmap
-
     def __new__(
         cls,
         *args,
@@ -399,13 +709,20 @@ class UriPath(Uri, Path):
         **kwargs,
     ) -> "UriPath":
         if cls is UriPath or findclass:
-            uri = Uri(*args, **kwargs)
+            if len(args) == 1 and isinstance(args[0], Uri):
+                uri = args[0]
+            else:
+                uri = Uri(*args, **kwargs)
             cls: type[UriPath] = uri.source.get_scheme_cls(schemesmap)
             if cls is UriPath:
                 inst = Uri.__new__(cls, *args, **kwargs)
             else:
                 inst = cls.__new__(cls, *args, **kwargs)
+            # inst is fully initiated from the parsed uri, __init__ will not
+            # parse args again, carry over the uri string it may already have
             inst._init(uri.source, uri.path, uri.query, uri.fragment, **kwargs)
+            if inst._path == uri.path:
+                inst._uri = uri._uri
         else:
             inst = Uri.__new__(cls, *args, **kwargs)
             backend = kwargs.get("backend", None)
@@ -414,7 +731,8 @@ class UriPath(Uri, Path):
                     if isinstance(segment, cls):
                         backend = segment.backend
                         break
-            inst._backend = backend
+            if backend is not None:
+                inst._backend = backend
         return inst
 
     def _initbackend(self):
@@ -441,16 +759,18 @@ class UriPath(Uri, Path):
             self._backend = backend
         super()._init(source, path, query, fragment, **kwargs)
 
-    @property
+    @_utils.cached_slot
     def backend(self):
-        if self._backend is None:
-            self._backend = self._initbackend()
-        return self._backend
+        return self._initbackend()
 
     def with_backend(self, backend):
         return self._from_parsed_parts(*self.parts, backend=backend)
 
     def __truediv__(self, key: str | Uri | os.PathLike):
+        if isinstance(key, str) and self.source.get_scheme_cls() is type(self):
+            inst = self._join_plain(key, backend=self.backend)
+            if inst is not None:
+                return inst
         try:
             return type(self)(self, key, findclass=True)
         except (TypeError, NotImplementedError):
@@ -463,20 +783,36 @@ class UriPath(Uri, Path):
         elif source.scheme not in cls._schemes():
             inst = cls.__new__(cls, source.scheme + ":", findclass=True)
         else:
-            inst = cls.__new__(cls, backend=self._backend)
+            inst = cls.__new__(cls, backend=getattr(self, "_backend", None))
         inst._init(source, self.path, self.query, self.fragment)
         return inst
 
     @_utils.notimplemented
-    def _listdir(self) -> "_ty.Iterator[str]": ...
+    def _listdir(self) -> "_ty.Iterator[str | tuple[str, int | None]]":
+        """
+        Names of the directory entries, backends that get the file type
+        from the listing itself can yield (name, st_mode) instead
+        """
+        ...
 
     def _make_child_relpath(self, name: str, **kwargs) -> _ty.Self:
         inst = super()._make_child_relpath(name, backend=self.backend, **kwargs)
         return inst
 
+    def _iterdir_modes(self) -> "_ty.Iterator[tuple[Self, int | None]]":
+        cls = type(self)
+        source, backend, prefix = self.source, self.backend, self._child_prefix()
+        for name in self._listdir():
+            mode = None
+            if isinstance(name, tuple):
+                name, mode = name
+            inst = cls.__new__(cls)
+            inst._init(source, prefix + name, "", "", backend=backend)
+            yield inst, mode
+
     def iterdir(self) -> "_ty.Iterator[Self]":
-        for path in self._listdir():
-            yield self._make_child_relpath(path)
+        for inst, _ in self._iterdir_modes():
+            yield inst
 
 
 _ROOT = Uri("/")
@@ -1,4 +1,5 @@
 import typing as _ty
+from urllib.parse import unquote as _unquote
 
 import uritools as _uritools
 
@@ -51,7 +52,13 @@ class Query(str):
 
     def to_dict(query, *, single=False):
         query_: dict[str, list[str | None]] = {}
-        for k, v in query.decode():
+        encoding = query._encoding
+        for pair in query.split(query._separator):
+            if not pair:
+                continue
+            k, eq, v = pair.partition("=")
+            k = _unquote(k, encoding, "strict")
+            v = _unquote(v, encoding, "strict") if eq else None
             if single:
                 query_[k] = v
             else:
@@ -1,37 +1,64 @@
 import os as _os
+import stat as _stat
 
+from ... import utils as _utils
 from ...fspath import LocalPath as _Local
 from ...path import FsPathLike
 from .. import Source, UriPath
 
 
+def _entry_mode(entry: _os.DirEntry):
+    # file type from the directory listing, without an extra stat call.
+    # These fall back to lstat without d_type, leave errors to walk's stat
+    try:
+        if entry.is_symlink():
+            return _stat.S_IFLNK
+        elif entry.is_dir(follow_symlinks=False):
+            return _stat.S_IFDIR
+        elif entry.is_file(follow_symlinks=False):
+            return _stat.S_IFREG
+    except OSError:
+        pass
+    return None
+
+
 class FileUri(UriPath):
     __SCHEMES = ("file",)
     __slots__ = ("_filepath",)
 
-    @property
-    def filepath(self):
-        if self._filepath is None:
-            self._filepath = _Local(self.__fspath__())
-        return self._filepath
-
-    def _init(
-        self,
-        source: Source,
-        path: str,
-        query: str,
-        fragment: str,
-        /,
-        **kwargs,
-    ):
-        if _os.name == "nt" and path and path[0] == "/":
-            root, *_ = path[1:].split("/", maxsplit=1)
-            if root and root[-1] == ":":
-                path = path.removeprefix("/")
-        super()._init(source, path, query, fragment, **kwargs)
+    @_utils.cached_slot
+    def filepath(self) -> _Local:
+        return _Local(self.__fspath__())
+
+    if _os.name == "nt":
+
+        def _init(
+            self,
+            source: Source,
+            path: str,
+            query: str,
+            fragment: str,
+            /,
+            **kwargs,
+        ):
+            # drop the leading slash of drive paths, /C:/dir -> C:/dir
+            if path and path[0] == "/":
+                end = path.find("/", 1)
+                if end < 0:
+                    end = len(path)
+                if end > 1 and path[end - 1] == ":":
+                    path = path[1:]
+            super()._init(source, path, query, fragment, **kwargs)
+
+        def _raw_uri(self):
+            # _init drops the leading slash of drive paths, as_uri has to
+            # be composed from the parsed parts
+            return None
 
     def _listdir(self):
-        yield from _os.listdir(self.filepath)
+        with _os.scandir(self.filepath) as entries:
+            for entry in entries:
+                yield entry.name, _entry_mode(entry)
 
     def stat(self, *, follow_symlinks=True):
         return self.filepath.stat(follow_symlinks=follow_symlinks)
@@ -1,10 +1,9 @@
 import io as _io
+import stat as _stat
 import time as _time
 import typing as _ty
 
-import bs4 as _bs4
 import requests as _req
-from htmllistparse import parse as _htmlparse
 
 if _ty.TYPE_CHECKING:
     from urllib3.response import HTTPResponse
@@ -48,17 +47,26 @@ class HttpPath(UriPath):
     def _listdir(self) -> list[_FileEntry]:
         req = self.backend.request("GET", self)
         req.raise_for_status()
+        # only directory listings need the html parsers
+        import bs4 as _bs4
+        from htmllistparse import parse as _htmlparse
+
         soup = _bs4.BeautifulSoup(req.content, "html5lib")
         _, listing = _htmlparse(soup)
         return listing
 
-    def iterdir(self):
-        _self = self.path.removesuffix("/")
+    def _iterdir_modes(self):
         cls = type(self)
+        source, backend = self.source, self.backend
+        prefix = self.path.removesuffix("/") + "/"
         for path in self._listdir():
-            inst = type(self).__new__(cls, backend=self.backend)
-            inst._init(self.source, f"{_self}/{path.name}", "", "")
-            yield inst
+            inst = cls.__new__(cls, backend=backend)
+            inst._init(source, prefix + path.name, "", "")
+            if path.name.endswith("/"):
+                inst._isdir = True
+                yield inst, _stat.S_IFDIR
+            else:
+                yield inst, None
 
     def _is_dir(self, resp: _req.Response):
         return (
@@ -80,7 +88,7 @@ class HttpPath(UriPath):
             if resp.status_code < 400:
                 break
 
-        if self._isdir is None:
+        if getattr(self, "_isdir", None) is None:
             self._isdir = self._is_dir(resp)
 
         if resp.is_redirect:
@@ -131,7 +139,7 @@ class HttpPath(UriPath):
         )
 
     def is_dir(self):
-        if self._isdir is None:
+        if getattr(self, "_isdir", None) is None:
             self.stat()
         return self._is_dir is not None and self._isdir
 
@@ -76,8 +76,8 @@ class SftpPath(UriPath):
         return client
 
     def _listdir(self):
-        for path in self._sftpclient.listdir(self.path):
-            yield path
+        for attr in self._sftpclient.listdir_attr(self.path):
+            yield attr.filename, attr.st_mode
 
     def stat(self, *, follow_symlinks=True):
         if follow_symlinks:
@@ -1,5 +1,7 @@
+import functools as _functools
 import ipaddress as _ip
 import socket as _socket
+import sys as _sys
 import typing as _ty
 
 import uritools as _uritools
@@ -35,7 +37,9 @@ class Source(_ty.NamedTuple):
         uri = _uritools.urisplit(source)
         if strict and (uri.path or uri.fragment or uri.query):
             raise ValueError(source)
-        return cls(uri.getscheme(), uri.getuserinfo(), uri.gethost(), uri.getport())
+        return _intern_source(
+            uri.getscheme(), uri.getuserinfo(), uri.gethost(), uri.getport()
+        )
 
     def keys(self):
         return self._asdict().keys()
@@ -46,11 +50,8 @@ class Source(_ty.NamedTuple):
         return getattr(self, key)
 
     def parsed_userinfo(self):
-        parts = []
-        if self.userinfo:
-            parts = self.userinfo.split(":", maxsplit=1)
-        parts = parts + ["", ""]
-        return parts[0], parts[1]
+        user, _, password = (self.userinfo or "").partition(":")
+        return user, password
 
     def get_scheme_cls(self, schemesmap: _ty.Mapping[str, type["UriPath"]] = None):
         from . import UriPath
@@ -67,8 +68,48 @@ class Source(_ty.NamedTuple):
         if not host or host == "localhost":
             return True
         if isinstance(host, str):
-            host = _ip.ip_address(_socket.gethostbyname(host))
+            host = _resolve_host(host)
         return host.is_loopback or host in _utils.get_machine_ips()
 
 
-_NOSOURCE = Source(None, None, None, None)
+@_functools.lru_cache(maxsize=1024)
+def _resolve_host(host: str) -> _IPAddress:
+    """
+    Resolved address of host, cached for the life of the process so
+    repeated is_local checks don't block on DNS. Call _resolve_host.cache_clear()
+    if name resolution is expected to change.
+    """
+    try:
+        return _ip.ip_address(host)
+    except ValueError:
+        return _ip.ip_address(_socket.gethostbyname(host))
+
+
+def _intern_source(
+    scheme: str | None,
+    userinfo: str | None,
+    host: str | _IPAddress | None,
+    port: int | None,
+) -> Source:
+    """Shared Source for the given parts, uris from the same origin reuse one tuple"""
+    if userinfo:
+        # not memoized, the cache would keep the userinfo and its password
+        return _cached_source.__wrapped__(scheme, userinfo, host, port)
+    return _cached_source(scheme, userinfo, host, port)
+
+
+@_functools.lru_cache(maxsize=1024)
+def _cached_source(
+    scheme: str | None,
+    userinfo: str | None,
+    host: str | _IPAddress | None,
+    port: int | None,
+) -> Source:
+    if scheme:
+        scheme = _sys.intern(scheme)
+    if host and isinstance(host, str):
+        host = _sys.intern(host)
+    return Source(scheme, userinfo, host, port)
+
+
+_NOSOURCE = _intern_source(None, None, None, None)
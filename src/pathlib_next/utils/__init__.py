@@ -1,5 +1,6 @@
 import collections
 import functools as _functools
+import math as _math
 import time as _time
 import typing as _ty
 from email.utils import parsedate as _parsedate
@@ -50,29 +51,63 @@ class LRU(_ty.Generic[K, V]):
         return self(*args)
 
 
+class cached_slot(_ty.Generic[V]):
+    """
+    Like functools.cached_property for classes with __slots__, the value is
+    stored in the slot named after the property with a leading underscore
+    """
+
+    def __init__(self, func: _ty.Callable[[_ty.Any], V]):
+        self.func = func
+        self.slot = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str):
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None) -> V:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+
+@_functools.lru_cache(maxsize=2048)
+def _parsedate_str(date: str) -> float:
+    return _time.mktime(_parsedate(date))
+
+
 def parsedate(date: _ty.Union[str, _time.struct_time, tuple, float]):
     if date is None:
         return _time.time()
     if isinstance(date, str):
-        date = _parsedate(date)
+        return _parsedate_str(date)
     return _time.mktime(date)
 
 
+_SIZE_UNITS = ("", "K", "M", "G", "T", "P", "E", "Z", "Y")
+
+
 def sizeof_fmt(num: _ty.Union[int, float]):
-    for unit in ("", "K", "M", "G", "T", "P", "E", "Z"):
-        if abs(num) < 1024:
-            if unit:
-                return "%3.1f%s" % (num, unit)
-            else:
-                return int(num)
-        num /= 1024.0
-    return "%.1f%s" % (num, "Y")
+    if abs(num) < 1024:
+        return int(num)
+    # every unit is 2**10 of the previous one, scaling by powers of two is
+    # exact so this matches dividing by 1024 once per unit
+    num = float(num)
+    idx = min((_math.frexp(num)[1] - 1) // 10, 8) if _math.isfinite(num) else 8
+    return "%3.1f%s" % (num / 1024.0**idx, _SIZE_UNITS[idx])
 
 
 def notimplemented(method):
+    msg = f"Not implemented method {method.__name__}"
+
     @_functools.wraps(method)
     def _notimplemented(*args, **kwargs):
-        raise NotImplementedError(f"Not implement method  {method.__name__}")
+        raise NotImplementedError(msg)
 
     return _notimplemented
 
@@ -81,7 +116,12 @@ import ipaddress as _ip
 import socket as _socket
 
 
-def get_machine_ips():
+@_functools.lru_cache(maxsize=1)
+def get_machine_ips() -> tuple[_ip.IPv4Address | _ip.IPv6Address, ...]:
+    """
+    Addresses of this machine, looked up once and cached. Interfaces added
+    afterwards are only seen after get_machine_ips.cache_clear()
+    """
     ips: list[_ip.IPv4Address | _ip.IPv6Address] = list()
     for item in _socket.getaddrinfo(_socket.gethostname(), None):
         protocol, *_, (ip, *_) = item
@@ -90,4 +130,4 @@ def get_machine_ips():
         elif protocol == _socket.AddressFamily.AF_INET6:
             ips.append(_ip.ip_address(ip))
 
-    return ips
+    return tuple(ips)
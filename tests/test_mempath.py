@@ -0,0 +1,75 @@
+import os
+import pathlib
+
+import pytest
+
+import src.pathlib_next as pathlib_next
+from src.pathlib_next.mempath import MemPath
+from src.pathlib_next.protocols.io import _COPY_BUFSIZE
+
+
+@pytest.fixture
+def src():
+    path = MemPath("src")
+    path.write_bytes(b"data")
+    return path
+
+
+def test_copy(src: MemPath):
+    target = MemPath("target", backend=src.backend)
+    src.copy(target)
+    assert target.read_bytes() == b"data"
+
+
+def test_copy_existing(src: MemPath):
+    target = MemPath("target", backend=src.backend)
+    target.write_bytes(b"old")
+    with pytest.raises(FileExistsError):
+        src.copy(target)
+    assert target.read_bytes() == b"old"
+
+
+@pytest.mark.parametrize("existing", [False, True])
+def test_copy_overwrite(src: MemPath, existing: bool):
+    target = MemPath("target", backend=src.backend)
+    if existing:
+        target.write_bytes(b"old")
+    src.copy(target, overwrite=True)
+    assert target.read_bytes() == b"data"
+
+
+def test_mkdir_parents():
+    path = MemPath("a/b/c/d")
+    path.mkdir(parents=True)
+    assert path.backend == {"a": {"b": {"c": {"d": {}}}}}
+    with pytest.raises(FileExistsError):
+        path.mkdir(parents=True)
+    path.mkdir(parents=True, exist_ok=True)
+    MemPath("a/b/e/f", backend=path.backend).mkdir(parents=True)
+    assert path.backend == {"a": {"b": {"c": {"d": {}}, "e": {"f": {}}}}}
+
+
+def test_mkdir_parents_existing_file():
+    path = MemPath("a/b/file")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"")
+    with pytest.raises(FileExistsError):
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def test_mkdir_no_parents():
+    with pytest.raises(FileNotFoundError):
+        MemPath("a/b").mkdir()
+
+
+def test_copy_across_buffers(tmp_path: pathlib.Path):
+    # BytesIO has no file descriptor, these go through the readinto loop
+    data = os.urandom(_COPY_BUFSIZE * 2 + 123)
+    src = MemPath("src")
+    src.write_bytes(data)
+    file = pathlib_next.UriPath(tmp_path / "file")
+    src.copy(file)
+    assert (tmp_path / "file").read_bytes() == data
+    target = MemPath("target", backend=src.backend)
+    file.copy(target)
+    assert target.read_bytes() == data